@@ -1,14 +1,19 @@
-import functools
 import inspect
+import sys
 from dataclasses import dataclass
 from typing import Any
 
-import docstring_parser
+from docstring_parser import Docstring
 from stdl.st import ForegroundColor, colored
 
-from objinspect.function import _get_docstr_desc, _has_docstr
+from objinspect.function import (
+    _get_docstr_desc,
+    _parse_docstring_cached,
+    cached_property,
+)
 from objinspect.method import Method, MethodFilter
 from objinspect.parameter import Parameter
+from objinspect.util import _iter_function_members
 
 
 @dataclass
@@ -21,6 +26,8 @@ class ClassStrTheme:
 class Class:
     """
     Wraps  a class or class instance and provides information about its methods.
+    Methods are ordered by definition, with methods defined on the class itself
+    coming before inherited ones (following the MRO).
 
     Args:
         cls (type or object): The class or class instance to wrap.
@@ -43,6 +50,24 @@ class Class:
         description (str): The description of the class from its docstring.
     """
 
+    __slots__ = (
+        "_cached__methods",
+        "_cached__methods_tuple",
+        "_cached__parsed_docstring",
+        "_cached_description",
+        "_cached_has_init",
+        "_class_base",
+        "cls",
+        "docstring",
+        "extractor_kwargs",
+        "has_docstring",
+        "instance",
+        "is_initialized",
+        "name",
+        "receieved_instance",
+        "skip_self",
+    )
+
     def __init__(
         self,
         cls,
@@ -68,8 +93,9 @@ class Class:
             self.is_initialized = True
 
         self.instance = None if not self.is_initialized else self.cls
+        self._class_base = self.cls.__class__ if self.is_initialized else self.cls
         self.docstring = inspect.getdoc(self.cls)
-        self.has_docstring = _has_docstr(self.docstring)
+        self.has_docstring = bool(self.docstring)
         self.extractor_kwargs = {
             "init": init,
             "public": public,
@@ -79,32 +105,48 @@ class Class:
             "private": private,
             "classmethod": classmethod,
         }
-        self._methods = self._find_methods()
-        self.has_init = "__init__" in self._methods
-        self._parsed_docstring = (
-            docstring_parser.parse(self.docstring) if self.has_docstring else None  # type: ignore
-        )
-        self.description = _get_docstr_desc(self._parsed_docstring)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}', methods={len(self._methods)}, has_init={self.has_init}, description={self.description})"
 
-    @functools.cached_property
-    def _class_base(self):
-        if self.is_initialized:
-            return self.cls.__class__
-        return self.cls
+    @cached_property
+    def _parsed_docstring(self) -> Docstring | None:
+        return _parse_docstring_cached(self.docstring)
+
+    @cached_property
+    def description(self) -> str:
+        return _get_docstr_desc(self._parsed_docstring)
+
+    @cached_property
+    def _methods(self) -> dict[str, Method]:
+        return self._find_methods()
+
+    @cached_property
+    def has_init(self) -> bool:
+        return "__init__" in self._methods
 
     def _find_methods(self) -> dict[str, Method]:
         method_filter = MethodFilter(**self.extractor_kwargs)
-        fn = inspect.isfunction if not self.is_initialized else inspect.ismethod
-        members = inspect.getmembers(self.cls, fn)
-        methods = {}
-        for method in method_filter.extract(
-            [Method(i[1], self._class_base, skip_self=self.skip_self) for i in members]
+        # Classes expose functions and staticmethods, instances expose bound methods
+        skipped = classmethod if not self.receieved_instance else staticmethod
+        is_member = inspect.isfunction if not self.receieved_instance else inspect.ismethod
+        members = []
+        for name, attr in _iter_function_members(
+            self._class_base, self.extractor_kwargs["inherited"]
         ):
-            methods[method.name] = method
-        return methods
+            if isinstance(attr, skipped):
+                continue
+            # Instance attributes can shadow methods, so check what the name resolves to
+            try:
+                value = getattr(self.cls, name)
+            except AttributeError:
+                continue
+            if is_member(value):
+                members.append(value)
+        methods = method_filter.extract(
+            [Method(i, self._class_base, skip_self=self.skip_self) for i in members]
+        )
+        return {sys.intern(method.name): method for method in methods}
 
     def init(self, *args, **kwargs) -> None:
         """
@@ -151,13 +193,11 @@ class Class:
         Returns:
             Method: The `Method` object representing the requested method.
         """
-        match method:
-            case str():
-                return self._methods[method]
-            case int():
-                return self.methods[method]
-            case _:
-                raise TypeError(type(method))
+        if isinstance(method, str):
+            return self._methods[method]
+        if isinstance(method, int):
+            return self._methods_tuple[method]
+        raise TypeError(type(method))
 
     @property
     def init_method(self):
@@ -172,12 +212,16 @@ class Class:
             return None
         return self.init_method.params
 
+    @cached_property
+    def _methods_tuple(self) -> tuple[Method, ...]:
+        return tuple(self._methods.values())
+
     @property
     def methods(self) -> list[Method]:
         """
         Returns the list of methods of the class or instance as a list of :class:`Function` objects.
         """
-        return list(self._methods.values())
+        return list(self._methods_tuple)
 
     @property
     def dict(self) -> dict[str, Any]:
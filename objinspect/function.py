@@ -1,7 +1,9 @@
+import functools
 import inspect
+import sys
+import weakref
 from dataclasses import dataclass
-from types import NoneType
-from typing import Any, Callable
+from typing import Any, Callable, Generic, TypeVar
 
 import docstring_parser
 from docstring_parser import Docstring
@@ -11,11 +13,92 @@ from objinspect.constants import EMPTY
 from objinspect.parameter import Parameter
 from objinspect.typing import type_name
 
+_T = TypeVar("_T")
+
+
+class cached_property(Generic[_T]):
+    """
+    A minimal version of `functools.cached_property` without the internal lock.
+    Works with classes that define `__slots__`: the computed value is stored in the
+    `_cached_<name>` slot, which the owner class must declare.
+    Assigning to the attribute replaces the cached value.
+    """
+
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        self.func = func
+        self.slotname = f"_cached_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slotname = f"_cached_{name}"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> _T:
+        if instance is None:
+            return self  # type: ignore
+        try:
+            return getattr(instance, self.slotname)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slotname, value)
+            return value
+
+    def __set__(self, instance: Any, value: _T) -> None:
+        setattr(instance, self.slotname, value)
+
+
+_SIG_CACHE: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = weakref.WeakKeyDictionary()
+
+
+def _get_signature(func: Callable) -> inspect.Signature:
+    """
+    Get the signature of a callable, reusing a previously computed one while the callable is alive.
+    Callables that can't be weakly referenced are not cached.
+
+    The cache is never invalidated: changing `__signature__`, `__wrapped__` or the annotations
+    of a callable after its signature was first computed is not reflected.
+    """
+    try:
+        return _SIG_CACHE[func]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable or not weakly referenceable
+        return inspect.signature(func)
+
+    signature = inspect.signature(func)
+    _SIG_CACHE[func] = signature
+    return signature
+
 
 def _has_docstr(docstring: str | None) -> bool:
-    if docstring is None:
-        return False
-    return len(docstring) != 0
+    return bool(docstring)
+
+
+_FUNCTION_CACHE: "weakref.WeakValueDictionary[tuple, Function]" = weakref.WeakValueDictionary()
+
+
+def _get_or_create_cached(key: tuple, factory: Callable[[], "Function"]) -> "Function":
+    """
+    Return the live `Function` stored under `key`, or create and store one with `factory`.
+    """
+    try:
+        obj = _FUNCTION_CACHE.get(key)
+    except TypeError:  # unhashable callable
+        return factory()
+    if obj is None:
+        obj = factory()
+        _FUNCTION_CACHE[key] = obj
+    return obj
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_docstring_cached(docstring: str | None) -> Docstring | None:
+    """
+    Parse a docstring with `docstring_parser`, caching the result by docstring.
+    Returns None for an empty or missing docstring.
+    """
+    if not docstring:
+        return None
+    return docstring_parser.parse(docstring)
 
 
 def _get_docstr_desc(docstring: Docstring | None) -> str:
@@ -55,41 +138,82 @@ class Function:
 
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_cached__parameters",
+        "_cached__params_tuple",
+        "_cached__parsed_docstr",
+        "_cached__signature",
+        "_cached_description",
+        "_cached_return_type",
+        "docstring",
+        "func",
+        "has_docstring",
+        "name",
+        "skip_self",
+    )
+
     def __init__(self, func: Callable, skip_self: bool = True) -> None:
         self.func = func
         self.skip_self = skip_self
         self.name: str = self.func.__name__
         self.docstring = inspect.getdoc(self.func)
-        self.has_docstring = _has_docstr(self.docstring)
-        self._parsed_docstr: Docstring | None = (
-            docstring_parser.parse(self.docstring) if self.has_docstring else None  # type: ignore
-        )
-        self.return_type = NoneType
-        self._parameters = self._get_parameters()
-        self.description = _get_docstr_desc(self._parsed_docstr)
+        self.has_docstring = bool(self.docstring)
+
+    @classmethod
+    def from_callable(cls, func: Callable, skip_self: bool = True) -> "Function":
+        """
+        Create a `Function` for the given callable, reusing a live one if it was already created.
+        The returned object is shared with every other caller and must be treated as immutable.
+
+        Args:
+            func (Callable): The function to be inspected.
+            skip_self (bool, optional): Whether to skip the self parameter.
+        """
+        return _get_or_create_cached((cls, func, skip_self), lambda: cls(func, skip_self))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}', parameters={len(self._parameters)}, description='{self.description}')"
 
+    @cached_property
+    def _parsed_docstr(self) -> Docstring | None:
+        return _parse_docstring_cached(self.docstring)
+
+    @cached_property
+    def _signature(self) -> inspect.Signature:
+        return _get_signature(self.func)
+
+    @cached_property
+    def _parameters(self) -> dict[str, Parameter]:
+        return self._get_parameters()
+
+    @cached_property
+    def description(self) -> str:
+        return _get_docstr_desc(self._parsed_docstr)
+
+    @cached_property
+    def return_type(self) -> Any:
+        return self._signature.return_annotation
+
     def _get_parameters(self) -> dict[str, Parameter]:
-        signature = inspect.signature(self.func)
-        params = [Parameter.from_inspect_param(i) for i in signature.parameters.values()]
-        self.return_type = signature.return_annotation
+        params = [Parameter.from_inspect_param(i) for i in self._signature.parameters.values()]
 
         # Try finding descriptions for parameters
-        if self._parsed_docstr is not None:
-            params_mapping = {par.arg_name: par for par in self._parsed_docstr.params}
+        docstr_params = self._parsed_docstr.params if self._parsed_docstr is not None else ()
+        if docstr_params:
+            descriptions = {
+                par.arg_name: par.description for par in docstr_params if par.description
+            }
             for param in params:
-                if parameter := params_mapping.get(param.name, False):
-                    if parameter.description:  # type: ignore
-                        param.description = parameter.description  # type: ignore
+                if description := descriptions.get(param.name):
+                    param.description = description
 
-        parameters = {}
-        for param in params:
-            if param.name == "self" and self.skip_self:
-                continue
-            parameters[param.name] = param
-        return parameters
+        # Interned keys let lookups with identifier literals hit the identity fast path
+        return {
+            sys.intern(param.name): param
+            for param in params
+            if not (param.name == "self" and self.skip_self)
+        }
 
     def get_param(self, arg: str | int) -> Parameter:
         """
@@ -104,13 +228,11 @@ class Function:
         Raises:
             TypeError: If arg is not a string or an integer.
         """
-        match arg:
-            case str():
-                return self._parameters[arg]
-            case int():
-                return self.params[arg]
-            case _:
-                raise TypeError(type(arg))
+        if isinstance(arg, str):
+            return self._parameters[arg]
+        if isinstance(arg, int):
+            return self._params_tuple[arg]
+        raise TypeError(type(arg))
 
     def call(self, *args, **kwargs) -> Any:
         """
@@ -122,12 +244,16 @@ class Function:
         """
         return self.func(*args, **kwargs)
 
+    @cached_property
+    def _params_tuple(self) -> tuple[Parameter, ...]:
+        return tuple(self._parameters.values())
+
     @property
     def params(self) -> list[Parameter]:
         """
         Returns a list of parameters of the function.
         """
-        return list(self._parameters.values())
+        return list(self._params_tuple)
 
     @property
     def dict(self) -> dict[str, Any]:
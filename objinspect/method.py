@@ -1,7 +1,7 @@
 import inspect
 from inspect import _ParameterKind
 
-from objinspect.function import Function
+from objinspect.function import Function, _get_or_create_cached
 
 
 class Method(Function):
@@ -30,10 +30,27 @@ class Method(Function):
 
     """
 
+    __slots__ = ("cls",)
+
     def __init__(self, method, cls, skip_self: bool = True):
         super().__init__(method, skip_self)
         self.cls = cls
 
+    @classmethod
+    def from_callable(cls, method, owner, skip_self: bool = True) -> "Method":  # type: ignore[override]
+        """
+        Create a `Method` for the given method and class, reusing a live one if it was already created.
+        The returned object is shared with every other caller and must be treated as immutable.
+
+        Args:
+            method (Callable): The method to be inspected.
+            owner (type): The class to which the method belongs.
+            skip_self (bool, optional): Whether to skip the self parameter.
+        """
+        return _get_or_create_cached(  # type: ignore
+            (cls, method, owner, skip_self), lambda: cls(method, owner, skip_self)
+        )
+
     @property
     def class_instance(self):
         return getattr(self.func, "__self__", None)
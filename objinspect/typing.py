@@ -6,8 +6,44 @@ from typing import Any, Type
 
 import typing_extensions
 
-ALIAS_TYPES = [typing._GenericAlias, types.GenericAlias]  # type:ignore
-UNION_TYPES = [typing._UnionGenericAlias, types.UnionType]  # type:ignore
+ALIAS_TYPES = frozenset([typing._GenericAlias, types.GenericAlias])  # type:ignore
+UNION_TYPES = (typing._UnionGenericAlias, types.UnionType)  # type:ignore
+
+_TYPING_ITERABLES = frozenset(
+    [
+        typing.List,
+        typing.Tuple,
+        typing.Dict,
+        typing.Set,
+        typing.FrozenSet,
+        typing.Deque,
+        typing.DefaultDict,
+        typing.OrderedDict,
+        typing.ChainMap,
+        typing.Counter,
+        typing.Generator,
+        typing.AsyncGenerator,
+        typing.Iterable,
+        typing.Collection,
+        typing.AbstractSet,
+        typing.MutableSet,
+        typing.Mapping,
+        typing.MutableMapping,
+        typing.Sequence,
+        typing.MutableSequence,
+    ]
+)
+
+_TYPING_MAPPINGS = frozenset(
+    [
+        typing.Dict,
+        typing.Mapping,
+        typing.MutableMapping,
+        typing.DefaultDict,
+        typing.OrderedDict,
+        typing.ChainMap,
+    ]
+)
 
 
 def type_name(t: Any) -> str:
@@ -28,6 +64,9 @@ def type_name(t: Any) -> str:
         'int'
         ```
     """
+    # Plain classes: "<class 'module.Name'>" reduces to the class name
+    if isinstance(t, type) and type(t).__repr__ is type.__repr__:
+        return t.__name__
     type_str = repr(t)
     if "<class '" in type_str:
         type_str = type_str.split("'")[1]
@@ -78,7 +117,7 @@ def is_union_type(t) -> bool:
         False
         ```
     """
-    return type(t) in UNION_TYPES
+    return isinstance(t, UNION_TYPES)
 
 
 def is_iterable_type(t) -> bool:
@@ -99,31 +138,9 @@ def is_iterable_type(t) -> bool:
         True
         ```
     """
-    typing_iterables = [
-        typing.List,
-        typing.Tuple,
-        typing.Dict,
-        typing.Set,
-        typing.FrozenSet,
-        typing.Deque,
-        typing.DefaultDict,
-        typing.OrderedDict,
-        typing.ChainMap,
-        typing.Counter,
-        typing.Generator,
-        typing.AsyncGenerator,
-        typing.Iterable,
-        typing.Collection,
-        typing.AbstractSet,
-        typing.MutableSet,
-        typing.Mapping,
-        typing.MutableMapping,
-        typing.Sequence,
-        typing.MutableSequence,
-    ]
     if isinstance(t, (types.GenericAlias, typing._GenericAlias)):  # type:ignore
         t = t.__origin__
-    if t in typing_iterables:
+    if t in _TYPING_ITERABLES:
         return True
     return issubclass(t, Iterable)
 
@@ -144,17 +161,9 @@ def is_mapping_type(t) -> bool:
         True
         ```
     """
-    typing_mappings = [
-        typing.Dict,
-        typing.Mapping,
-        typing.MutableMapping,
-        typing.DefaultDict,
-        typing.OrderedDict,
-        typing.ChainMap,
-    ]
     if isinstance(t, (types.GenericAlias, typing._GenericAlias)):  # type:ignore
         t = t.__origin__
-    if t in typing_mappings:
+    if t in _TYPING_MAPPINGS:
         return True
     return issubclass(t, Mapping)
 
@@ -207,7 +216,15 @@ def get_enum_choices(e) -> tuple[str, ...]:
     """
     if not is_enum(e):
         raise TypeError(f"'{e}' is not an Enum")
-    return tuple(e.__members__.keys())
+    # Read from the class's own namespace so subclasses don't pick up a base Enum's choices
+    choices = e.__dict__.get("_objinspect_choices")
+    if choices is None:
+        choices = tuple(e.__members__.keys())
+        try:
+            e._objinspect_choices = choices
+        except (AttributeError, TypeError):
+            pass
+    return choices
 
 
 def is_direct_literal(t: Any) -> bool:
@@ -260,12 +277,12 @@ def is_or_contains_literal(t: Any) -> bool:
         False
         ```
     """
-    if is_direct_literal(t):
-        return True
-
-    for i in typing.get_args(t):
-        if is_or_contains_literal(i):
+    stack = [t]
+    while stack:
+        current = stack.pop()
+        if is_direct_literal(current):
             return True
+        stack.extend(typing.get_args(current))
     return False
 
 
@@ -1,5 +1,5 @@
 from types import FunctionType
-from typing import Any, Callable, Tuple, Type
+from typing import Any, Callable, Iterator, Tuple, Type
 
 from stdl.st import TextStyle, with_style
 
@@ -34,11 +34,28 @@ def get_uninherited_methods(cls) -> list[str]:
     """
     Get the methods of a class that are not inherited from its parent classes.
     """
-    return [
-        name
-        for name, method in cls.__dict__.items()
-        if isinstance(method, (FunctionType, classmethod, staticmethod))
-    ]
+    return [name for name, _ in _iter_function_members(cls, inherited=False)]
+
+
+def _iter_function_members(cls: type, inherited: bool = True) -> Iterator[tuple[str, Any]]:
+    """
+    Iterate over the functions, staticmethods and classmethods defined on a class by walking its MRO.
+    Yields `(name, attribute)` pairs with the raw (unbound) attributes from each class's `__dict__`.
+    Names defined on a subclass shadow the same names on its bases. `object` is skipped.
+
+    Args:
+        cls (type): The class to scan.
+        inherited (bool, optional): Whether to include members defined on base classes.
+    """
+    mro = cls.__mro__[:-1] if inherited else cls.__mro__[:1]
+    seen = set()
+    for klass in mro:
+        for name, attr in klass.__dict__.items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(attr, (FunctionType, staticmethod, classmethod)):
+                yield name, attr
 
 
 def create_function(
@@ -65,3 +65,44 @@ def test_class_inheritance():
     cls = Class(ExampleClassC)
     inherited_methods = [method for method in cls.methods if method.is_inherited]
     assert any(method.name == "inherited_method" for method in inherited_methods)
+
+
+def test_methods_list_is_a_copy():
+    cls = Class(ExampleClassA)
+    assert cls.get_method(1) is cls.methods[1]
+    cls.methods.pop()
+    assert len(cls.methods) == len(cls._methods) == 3
+
+
+def test_methods_order():
+    cls = Class(ExampleClassC)
+    assert [method.name for method in cls.methods] == [
+        "__init__",
+        "public_method",
+        "static_method",
+        "inherited_method",
+    ]
+    assert cls.get_method(3).name == "inherited_method"
+
+
+def test_class_wrappers_are_isolated():
+    c1 = Class(ExampleClassA)
+    c2 = Class(ExampleClassA)
+    assert c1.get_method("__init__") is not c2.get_method("__init__")
+    c1.get_method("__init__").params[0].description = "mutated"
+    assert c2.get_method("__init__").params[0].description != "mutated"
+
+
+def test_instance_attributes_shadowing_methods():
+    instance = ExampleClassA("a", 1)
+    instance.method_1 = 5
+    instance.method_2 = lambda q: q
+    assert [method.name for method in Class(instance).methods] == ["__init__"]
+
+
+def test_cached_attributes_are_assignable():
+    cls = Class(ExampleClassA)
+    cls.description = "changed"
+    cls.has_init = False
+    assert cls.description == "changed"
+    assert cls.has_init is False
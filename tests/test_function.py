@@ -68,3 +68,24 @@ def test_async():
 
     assert not func.is_coroutine
     assert async_func.is_coroutine
+
+
+def test_parsed_docstring_is_cached():
+    assert Function(example_function)._parsed_docstr is func._parsed_docstr
+
+
+def test_signature_is_cached():
+    assert Function(example_function)._signature is func._signature
+
+
+def test_from_callable():
+    assert Function.from_callable(example_function) is Function.from_callable(example_function)
+    assert Function.from_callable(example_function, skip_self=False) is not Function.from_callable(
+        example_function
+    )
+
+
+def test_cached_attributes_are_assignable():
+    f = Function(example_function)
+    f.description = "changed"
+    assert f.description == "changed"
@@ -254,6 +254,13 @@ class TestTypeName:
 
         assert type_name(CustomClass) == "CustomClass"
 
+    def test_equal_types_written_differently(self):
+        assert Union[int, str] == (str | int)
+        assert type_name(Union[int, str]) == "Union[int, str]"
+        assert type_name(str | int) == "str | int"
+        assert type_name(Optional[int]) == "Optional[int]"
+        assert type_name(int | None) == "int | None"
+
 
 class TestTypeSimplified:
     @pytest.mark.parametrize(
@@ -438,6 +445,19 @@ def test_get_enum_choices(enum_types):
     assert get_enum_choices(enum_types["empty"]) == ()
 
 
+def test_get_enum_choices_cached_per_enum():
+    class Base(Enum):
+        pass
+
+    assert get_enum_choices(Base) == ()
+
+    class Derived(Base):
+        A = 1
+
+    assert get_enum_choices(Derived) == ("A",)
+    assert get_enum_choices(Derived) is get_enum_choices(Derived)
+
+
 def test_get_enum_choices_error():
     with pytest.raises(TypeError):
         get_enum_choices(int)
@@ -1,6 +1,6 @@
 import pytest
 
-from objinspect.util import create_function
+from objinspect.util import _iter_function_members, create_function
 
 
 class TestCreateFunction:
@@ -60,3 +60,30 @@ class TestCreateFunction:
     def test_edge_cases(self):
         nop = create_function(name="nop", args={}, body="pass", globs=globals())
         assert nop() is None
+
+
+class TestIterFunctionMembers:
+    class Base:
+        def method(self): ...
+
+        def overridden(self): ...
+
+    class Child(Base):
+        attr = 1
+
+        def overridden(self): ...
+
+        @staticmethod
+        def static(): ...
+
+        @classmethod
+        def klass(cls): ...
+
+    def test_inherited(self):
+        members = dict(_iter_function_members(self.Child))
+        assert set(members) == {"overridden", "static", "klass", "method"}
+        assert members["overridden"] is self.Child.__dict__["overridden"]
+
+    def test_not_inherited(self):
+        members = dict(_iter_function_members(self.Child, inherited=False))
+        assert set(members) == {"overridden", "static", "klass"}